@@ -105,8 +105,7 @@ def export():
         ("SELECT * FROM StockMaster WHERE Exchange = 'XTKS'", "db_tks.csv"),
         ("SELECT * FROM StockMaster WHERE Exchange = 'XNSE'", "db_nse.csv"),
     ]
-    for query, filename in exports:
-        csv_path = exporter.export_query_to_csv(query, filename)
+    for csv_path in exporter.export_many(exports):
         _export_logger.info("Exported to: %s", csv_path)
 
 
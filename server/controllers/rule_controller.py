@@ -101,9 +101,20 @@ def _handle_validation_error(e: Exception, exchange: str, product_type: str) ->
     )
 
 
+class _NoAliasDumper(yaml.Dumper):
+    """YAML dumper that writes repeated objects out in full instead of as &id/*id aliases.
+    
+    The rule loader shares identical rule dicts across files and rule sets.
+    """
+    
+    def ignore_aliases(self, data):
+        return True
+
+
 def _to_yaml_response(data: dict, status_code: int = 200) -> tuple:
     """Serialise *data* to a plain-text YAML response."""
-    yaml_output = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    yaml_output = yaml.dump(data, Dumper=_NoAliasDumper, default_flow_style=False,
+                            allow_unicode=True, sort_keys=False)
     return Response(yaml_output, mimetype='text/plain; charset=utf-8'), status_code
 
 
@@ -16,7 +16,7 @@ class OptionProcessor(BaseProcessor):
             exchange: Optional exchange code (e.g., 'XHKG', 'XNSE') for exchange-specific validation
         """
         super().__init__(loader, exchange)
-        self._validator_instance = InstrumentValidator(exchange=exchange, product_type="option")
+        self._validator_instance = InstrumentValidator.get(exchange=exchange, product_type="option")
     
     @property
     def product_type(self):
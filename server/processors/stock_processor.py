@@ -16,7 +16,7 @@ class StockProcessor(BaseProcessor):
             exchange: Optional exchange code (e.g., 'XHKG', 'XNSE') for exchange-specific validation
         """
         super().__init__(loader, exchange)
-        self._validator_instance = InstrumentValidator(exchange=exchange, product_type="stock")
+        self._validator_instance = InstrumentValidator.get(exchange=exchange, product_type="stock")
     
     @property
     def product_type(self):
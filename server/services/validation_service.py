@@ -56,7 +56,7 @@ class ValidationService:
                 # Fallback to default if config service fails
                 rules_dir = "config/rules"
         
-        self.rule_loader = RuleLoader(rules_dir=rules_dir)
+        self.rule_loader = RuleLoader.shared(rules_dir)
         self.instrument_service = InstrumentService(loader, exchange_map=self.exchange_map, product_type=product_type)
     
     def _get_data_source(self, exchange, product_type=None):
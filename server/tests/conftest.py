@@ -0,0 +1,52 @@
+"""Shared pytest fixtures for the server tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the server packages (validators, services, ...) importable from the tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def write_yaml(path, text):
+    """Write *text* to *path*, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    """A small modular rules tree: base, stock product type, one exchange and custom sets."""
+    root = tmp_path / "rules"
+    write_yaml(root / "base.yaml", """
+- type: ExpectColumnValuesToNotBeNull
+  column: isin
+- type: ExpectColumnValuesToNotBeNull
+  column: ric
+""")
+    write_yaml(root / "stock" / "base.yaml", """
+- type: ExpectColumnValuesToBeInSet
+  column: currency
+  value_set: [HKD, USD]
+""")
+    write_yaml(root / "stock" / "exchanges" / "xhkg" / "exchange.yaml", """
+- type: ExpectColumnValuesToMatchRegex
+  column: ric
+  regex: "^[0-9]+\\\\.HK$"
+""")
+    write_yaml(root / "stock" / "custom.yaml", """
+isin_check:
+  - type: ExpectColumnValuesToBeUnique
+    column: isin
+price_check:
+  - type: ExpectColumnValuesToBeBetween
+    column: price
+    min_value: 0
+""")
+    write_yaml(root / "stock" / "combined.yaml", """
+full_check:
+  include: [isin_check, price_check]
+""")
+    return root
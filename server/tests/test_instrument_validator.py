@@ -0,0 +1,88 @@
+"""Tests for InstrumentValidator: expectation specs, spec memo invalidation and validate_many."""
+
+import os
+
+import pytest
+
+pytest.importorskip("great_expectations")
+pd = pytest.importorskip("pandas")
+
+from validators.instrument_validator import InstrumentValidator
+
+
+def _spec_summary(specs):
+    """Return (expectation class name, column) pairs for *specs*."""
+    return [(expectation_class.__name__, params['column']) for expectation_class, params in specs]
+
+
+@pytest.fixture
+def validator(rules_dir):
+    InstrumentValidator.clear_suite_cache()
+    return InstrumentValidator(rules_dir=str(rules_dir), exchange="XHKG", product_type="stock")
+
+
+def test_specs_keep_declaration_order_and_duplicates(validator):
+    specs = validator._get_expectation_specs(
+        None, None,
+        custom_rules=[{"type": "ExpectColumnValuesToNotBeNull", "column": "isin, ric"}],
+        custom_rule_names=None,
+        custom_only=False,
+    )
+    
+    assert _spec_summary(specs) == [
+        ("ExpectColumnValuesToNotBeNull", "isin"),
+        ("ExpectColumnValuesToNotBeNull", "ric"),
+        ("ExpectColumnValuesToBeInSet", "currency"),
+        ("ExpectColumnValuesToMatchRegex", "ric"),
+        ("ExpectColumnValuesToNotBeNull", "isin"),
+        ("ExpectColumnValuesToNotBeNull", "ric"),
+    ]
+
+
+def test_specs_pick_up_rule_edits(validator, rules_dir):
+    before = validator._get_expectation_specs(None, None, None, ["isin_check"], custom_only=True)
+    assert _spec_summary(before) == [("ExpectColumnValuesToBeUnique", "isin")]
+    
+    custom_file = rules_dir / "stock" / "custom.yaml"
+    custom_file.write_text(custom_file.read_text().replace("column: isin", "column: sedol"))
+    stat = os.stat(custom_file)
+    os.utime(custom_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    after = validator._get_expectation_specs(None, None, None, ["isin_check"], custom_only=True)
+    assert _spec_summary(after) == [("ExpectColumnValuesToBeUnique", "sedol")]
+
+
+def test_unknown_expectation_type_raises(validator):
+    with pytest.raises(ValueError, match="Unknown expectation type"):
+        validator.validate(pd.DataFrame({"isin": ["A"]}), custom_rules=[{"type": "Foo", "column": "isin"}])
+
+
+def test_validate_many_returns_one_result_per_config(validator):
+    df = pd.DataFrame({
+        "isin": ["US0378331005", None],
+        "ric": ["0005.HK", "0700.HK"],
+        "currency": ["HKD", "USD"],
+        "price": [1.0, 2.0],
+    })
+    
+    results = validator.validate_many(df, [
+        {"suite_name": "full"},
+        {"suite_name": "price", "custom_rule_names": ["price_check"]},
+        {"suite_name": "full_check", "custom_rule_names": ["full_check"]},
+    ])
+    
+    assert isinstance(results, list)
+    assert [len(result.results) for result in results] == [4, 5, 6]
+    assert len(results[0].results) == len(validator.validate(df).results)
+
+
+def test_empty_rule_set_gives_empty_success(validator):
+    result = validator.validate_custom_only(pd.DataFrame({"isin": ["A"]}), suite_name="nothing")
+    
+    assert result.success
+    assert list(result.results) == []
+
+
+def test_validate_many_rejects_unknown_config_keys(validator):
+    with pytest.raises(TypeError):
+        validator.validate_many(pd.DataFrame({"isin": ["A"]}), [{"exchanges": "XHKG"}])
@@ -0,0 +1,143 @@
+"""Tests for RuleLoader: rule ordering, cache invalidation and return types."""
+
+import os
+
+import pytest
+
+from conftest import write_yaml
+from validators.rule_loader import RuleLoader, parse_generation
+
+
+def _touch_later(path):
+    """Move *path*'s mtime forward so an in-place edit is seen even on coarse clocks."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_combined_rules_order(rules_dir):
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    rules = loader.load_combined_rules(
+        exchange="XHKG",
+        product_type="stocks",
+        custom_rule_names=["full_check"],
+        custom_rules=[{"type": "ExpectColumnToExist", "column": "name"}],
+    )
+    
+    assert [(rule["type"], rule["column"]) for rule in rules] == [
+        ("ExpectColumnValuesToNotBeNull", "isin"),
+        ("ExpectColumnValuesToNotBeNull", "ric"),
+        ("ExpectColumnValuesToBeInSet", "currency"),
+        ("ExpectColumnValuesToMatchRegex", "ric"),
+        ("ExpectColumnValuesToBeUnique", "isin"),
+        ("ExpectColumnValuesToBeBetween", "price"),
+        ("ExpectColumnToExist", "name"),
+    ]
+
+
+def test_combined_rules_returns_independent_list(rules_dir):
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    first = loader.load_combined_rules(product_type="stock")
+    assert type(first) is list
+    first.append({"type": "ExpectColumnToExist", "column": "extra"})
+    
+    second = loader.load_combined_rules(product_type="stock")
+    assert type(second) is list
+    assert len(second) == len(first) - 1
+    assert loader.load_base_rules() == second[:2]
+
+
+def test_edited_file_is_picked_up(rules_dir):
+    loader = RuleLoader.shared(rules_dir)
+    assert len(loader.load_combined_rules()) == 2
+    
+    base_file = rules_dir / "base.yaml"
+    with open(base_file, "a") as f:
+        f.write("- type: ExpectColumnToExist\n  column: sedol\n")
+    _touch_later(base_file)
+    
+    rules = loader.load_combined_rules()
+    assert len(rules) == 3
+    assert rules[-1]["column"] == "sedol"
+
+
+def test_parse_generation_changes_only_on_parse(rules_dir):
+    loader = RuleLoader(rules_dir=rules_dir)
+    loader.load_combined_rules(exchange="XHKG", product_type="stock")
+    
+    generation = parse_generation()
+    loader.load_combined_rules(exchange="XHKG", product_type="stock")
+    assert parse_generation() == generation
+    
+    base_file = rules_dir / "base.yaml"
+    base_file.write_text(base_file.read_text() + "- type: ExpectColumnToExist\n  column: sedol\n")
+    _touch_later(base_file)
+    loader.load_combined_rules(exchange="XHKG", product_type="stock")
+    assert parse_generation() != generation
+
+
+def test_equal_rules_in_different_files_are_not_shared(tmp_path):
+    rule = "- type: ExpectColumnValuesToNotBeNull\n  column: isin\n"
+    write_yaml(tmp_path / "base.yaml", rule)
+    write_yaml(tmp_path / "stock" / "base.yaml", rule)
+    loader = RuleLoader(rules_dir=tmp_path)
+    
+    base_rules = loader.load_base_rules()
+    product_rules = loader.load_product_type_rules("stock")
+    assert base_rules == product_rules
+    assert base_rules[0] is not product_rules[0]
+
+
+def test_available_rule_sets_use_parsed_keys(rules_dir):
+    write_yaml(rules_dir / "custom.yaml", """
+defaults: &defaults
+  - type: ExpectColumnToExist
+    column: isin
+"quoted name": *defaults
+? explicit
+: *defaults
+""")
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    custom = loader.get_available_custom_rule_sets(product_type="stock")
+    assert custom == sorted(
+        ["defaults", "quoted name", "explicit", "isin_check", "price_check", "full_check"]
+    )
+    assert loader.get_available_combined_rule_sets(product_type="stock") == ["full_check"]
+    for name in custom:
+        assert loader.load_custom_rules_from_yaml([name], product_type="stock")
+
+
+def test_exchange_custom_rules_override_product_type(rules_dir):
+    write_yaml(rules_dir / "stock" / "exchanges" / "xhkg" / "custom.yaml", """
+isin_check:
+  - type: ExpectColumnValuesToNotBeNull
+    column: hk_isin
+""")
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    rules = loader.load_custom_rules_from_yaml(["isin_check"], product_type="stock", exchange="XHKG")
+    assert [rule["column"] for rule in rules] == ["hk_isin"]
+    rules = loader.load_custom_rules_from_yaml(["isin_check"], product_type="stock")
+    assert [rule["column"] for rule in rules] == ["isin"]
+
+
+def test_circular_include_raises(rules_dir):
+    write_yaml(rules_dir / "stock" / "combined.yaml", """
+first:
+  include: second
+second:
+  include: [isin_check, first]
+""")
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    with pytest.raises(ValueError, match="Circular reference"):
+        loader.load_custom_rules_from_yaml(["first"], product_type="stock")
+
+
+def test_unknown_rule_set_raises(rules_dir):
+    loader = RuleLoader(rules_dir=rules_dir)
+    
+    with pytest.raises(ValueError, match="'missing' not found"):
+        loader.load_custom_rules_from_yaml(["missing"], product_type="stock")
@@ -1,10 +1,18 @@
 """Utility class for exporting SQL query results to CSV."""
 
-import pandas as pd
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from config.config_service import ConfigService
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_config_service(env):
+    """Return one ConfigService per environment so config.json is parsed once per process."""
+    return ConfigService(env)
+
+
 class QueryExporter:
     """Utility class to execute SQL queries and export results to CSV."""
     
@@ -16,9 +24,9 @@ class QueryExporter:
             connection_string: Optional ODBC connection string.
                               If None, will use ConfigService to get from config.json
             config_service: Optional ConfigService instance.
-                           If None, creates a new one.
+                           If None, reuses a process-wide instance for the current ENV.
         """
-        self.config_service = config_service or ConfigService()
+        self.config_service = config_service or _shared_config_service(os.getenv('ENV', 'dev').lower())
         
         if connection_string:
             self.connection_string = connection_string
@@ -33,9 +41,9 @@ class QueryExporter:
                 "Connection string not provided and not found in config.json"
             )
         
-        # Ensure data folder exists
+        # Data folder is created on first export, so constructing an exporter
+        # never touches the filesystem
         self.data_folder = Path(self.config_service.get_data_folder())
-        self.data_folder.mkdir(exist_ok=True)
     
     def export_query_to_csv(self, query, filename):
         """
@@ -60,12 +68,14 @@ class QueryExporter:
                 "pyodbc is required for QueryExporter. "
                 "Install it with: pip install pyodbc"
             )
+        import pandas as pd
         
         # Ensure filename has .csv extension
         if not filename.endswith('.csv'):
             filename = f"{filename}.csv"
         
         # Build full file path
+        self.data_folder.mkdir(exist_ok=True)
         file_path = self.data_folder / filename
         
         try:
@@ -104,6 +114,23 @@ class QueryExporter:
         query = query_template.format(**params)
         return self.export_query_to_csv(query, filename)
     
+    def export_many(self, jobs, max_workers=4):
+        """
+        Export several queries to CSV concurrently.
+        
+        Exports are I/O bound (database wait + disk write), so they run on a
+        thread pool. Each export opens its own pyodbc connection.
+        
+        Args:
+            jobs: Iterable of (query, filename) tuples
+            max_workers: Maximum number of exports running at once
+        
+        Returns:
+            list: Paths to the created CSV files, in the same order as jobs
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda job: self.export_query_to_csv(*job), jobs))
+    
     def get_data_folder(self):
         """Get the data folder path."""
         return str(self.data_folder)
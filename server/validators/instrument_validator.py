@@ -1,15 +1,113 @@
 """Great Expectations validator for instrument data."""
 
+import itertools
 import logging
+import os
+import random
+import threading
 import time
+import types
+from collections import OrderedDict
 
-import great_expectations as gx
-import great_expectations.expectations as gxe
 import pandas as pd
-from .rule_loader import RuleLoader
+from .rule_loader import CompiledRule, RuleLoader, parse_generation
 
 logger = logging.getLogger(__name__)
 
+# Process-wide (context, data_source, data_asset, batch_definition) shared by every
+# InstrumentValidator. The whole-dataframe batch definition is reusable across
+# requests, so GE registration happens once per process instead of per validator.
+_shared_ge_state = None
+_shared_ge_lock = threading.Lock()
+
+# GE contexts are not thread-safe, so building suites and validating batches on the shared
+# context is serialized; loading rules and resolving specs happen outside the lock.
+_ge_run_lock = threading.RLock()
+
+# Validators shared across requests, keyed by (exchange, product_type, rules_dir) in LRU order.
+# A validator holds no per-request state and its GE work runs under _ge_run_lock, so one
+# instance can serve concurrent requests.
+_validator_pool = OrderedDict()
+_validator_pool_lock = threading.Lock()
+_MAX_POOLED_VALIDATORS = 64
+
+# get_context() keyword arguments that last produced a context; later creations call
+# them directly instead of probing ephemeral mode and falling back on the exception path
+_working_gx_context_kwargs = None
+
+# Suffix source for data source/asset/batch names, combined with the pid
+_data_source_seq = itertools.count(1)
+
+# Suffix source for suite names; every suite gets a unique name on the first try
+_suite_seq = itertools.count(1)
+
+# great_expectations is heavy to import, so it is loaded by _import_great_expectations()
+# on first use rather than at module import; these stay None until then
+gx = None
+gxe = None
+_ge_import_lock = threading.Lock()
+
+# Rule 'type' -> expectation class, filled in once GE is imported. Exposed read-only;
+# only _import_great_expectations() writes to the backing dict.
+_expectation_types = {}
+_EXPECTATION_TYPES = types.MappingProxyType(_expectation_types)
+
+# CompiledRule fields passed through to the expectation constructor when set
+_OPTIONAL_PARAM_KEYS = ('value_set', 'min_value', 'max_value', 'regex')
+
+# Recommended rows per chunk for validate_streaming(), e.g. pd.read_csv(..., chunksize=...).
+# Keeps GE's working memory to a few hundred MB on typical instrument frames.
+STREAMING_CHUNK_ROWS = 500_000
+# GE keeps at most this many sample values in partial_unexpected_* lists
+_PARTIAL_UNEXPECTED_LIMIT = 20
+
+# Expectation specs per rule-set signature: signature -> (parse generation, specs); see
+# _get_expectation_specs(). Cleared wholesale once it reaches _MAX_SPEC_MEMO.
+_spec_memo = {}
+_MAX_SPEC_MEMO = 256
+
+# Canonical rule form -> (expectation class, params), shared by every rule set that
+# contains an identical rule. Cleared wholesale once it reaches _MAX_INTERNED_SPECS.
+_interned_specs = {}
+_MAX_INTERNED_SPECS = 4096
+
+
+def _import_great_expectations():
+    """Import great_expectations once per process and fill the expectation type table."""
+    global gx, gxe
+    
+    if gxe is not None:
+        return
+    with _ge_import_lock:
+        if gxe is not None:
+            return
+        import great_expectations
+        import great_expectations.expectations as expectations
+        
+        _expectation_types.update({
+            'ExpectColumnValuesToBeUnique': expectations.ExpectColumnValuesToBeUnique,
+            'ExpectColumnValuesToNotBeNull': expectations.ExpectColumnValuesToNotBeNull,
+            'ExpectColumnValuesToBeInSet': expectations.ExpectColumnValuesToBeInSet,
+            'ExpectColumnValuesToBeBetween': expectations.ExpectColumnValuesToBeBetween,
+            'ExpectColumnValuesToMatchRegex': expectations.ExpectColumnValuesToMatchRegex,
+        })
+        gx = great_expectations
+        # Assigned last: a non-None gxe tells other threads the import is complete
+        gxe = expectations
+
+
+def _freeze_rule(value):
+    """
+    Return a hashable, order-independent form of a rule (nested dicts and lists included).
+    
+    Scalars are paired with their type so that True, 1 and 1.0 do not collide.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_rule(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_rule(item) for item in value)
+    return (type(value), value)
+
 
 class InstrumentValidator:
     """Handles Great Expectations validation for instrument data."""
@@ -32,50 +130,118 @@ class InstrumentValidator:
             except Exception:
                 rules_dir = "config/rules"
 
-        t0 = time.perf_counter()
-        context_errors = []
-        try:
-            self.context = gx.get_context(mode="ephemeral")
-        except Exception as e1:
-            context_errors.append(f"Ephemeral mode failed: {e1}")
-            try:
-                self.context = gx.get_context()
-            except Exception as e2:
-                context_errors.append(f"Regular context failed: {e2}")
+        self.context_name = context_name
+        self.exchange = exchange
+        self.product_type = product_type
+        self.rule_loader = RuleLoader.shared(rules_dir)
+        
+        _import_great_expectations()
+        self._attach_shared_data_source()
+    
+    @classmethod
+    def get(cls, exchange=None, product_type=None, rules_dir=None):
+        """
+        Return a shared validator for (exchange, product_type, rules_dir), creating it on first use.
+        
+        Use this instead of the constructor on request paths; the least recently
+        used validator is dropped once the pool holds _MAX_POOLED_VALIDATORS.
+        
+        Args:
+            exchange: Optional exchange code
+            product_type: Optional product type
+            rules_dir: Optional path to rules directory
+            
+        Returns:
+            InstrumentValidator: The pooled validator
+        """
+        key = (exchange, product_type, rules_dir)
+        with _validator_pool_lock:
+            validator = _validator_pool.get(key)
+            if validator is not None:
+                _validator_pool.move_to_end(key)
+                return validator
+        
+        # Build outside the lock; if another thread won the race, use its instance
+        validator = cls(rules_dir=rules_dir, exchange=exchange, product_type=product_type)
+        with _validator_pool_lock:
+            validator = _validator_pool.setdefault(key, validator)
+            _validator_pool.move_to_end(key)
+            while len(_validator_pool) > _MAX_POOLED_VALIDATORS:
+                _validator_pool.popitem(last=False)
+        return validator
+    
+    def _attach_shared_data_source(self):
+        """Attach the process-wide GE context and batch definition, creating them on first use."""
+        global _shared_ge_state
+        
+        state = _shared_ge_state
+        if state is None:
+            with _shared_ge_lock:
+                if _shared_ge_state is None:
+                    self._create_context()
+                    try:
+                        self._setup_data_source()
+                    except Exception as e:
+                        raise Exception(f"Failed to setup data source: {str(e)}")
+                    _shared_ge_state = (self.context, self.data_source, self.data_asset, self.batch_definition)
+                state = _shared_ge_state
+        
+        self.context, self.data_source, self.data_asset, self.batch_definition = state
+    
+    def _create_context(self):
+        """Create the Great Expectations context, preferring ephemeral mode.
+        
+        The mode that works is remembered for the process, so only the first
+        creation pays for probing.
+        """
+        global _working_gx_context_kwargs
+        
+        log_timing = logger.isEnabledFor(logging.DEBUG)
+        t0 = time.perf_counter() if log_timing else 0.0
+        if _working_gx_context_kwargs is not None:
+            self.context = gx.get_context(**_working_gx_context_kwargs)
+        else:
+            context_errors = []
+            for kwargs, label in (({"mode": "ephemeral"}, "Ephemeral mode"), ({}, "Regular context")):
+                try:
+                    self.context = gx.get_context(**kwargs)
+                except Exception as e:
+                    context_errors.append(f"{label} failed: {e}")
+                    continue
+                _working_gx_context_kwargs = kwargs
+                break
+            else:
                 raise Exception(
                     f"Failed to initialize Great Expectations context. "
                     f"Errors: {'; '.join(context_errors)}. "
                     "This may be due to YAML parsing issues or file handle conflicts."
                 )
-        logger.debug("[TIMING] GE context init completed in %.1f ms", (time.perf_counter() - t0) * 1000)
-        
-        self.context_name = context_name
-        self.exchange = exchange
-        self.product_type = product_type
-        self.rule_loader = RuleLoader(rules_dir=rules_dir)
-        
-        try:
-            self._setup_data_source()
-        except Exception as e:
-            raise Exception(f"Failed to setup data source: {str(e)}")
+        if log_timing:
+            logger.debug("[TIMING] GE context init completed in %.1f ms", (time.perf_counter() - t0) * 1000)
     
     def _setup_data_source(self):
         """Setup the pandas data source for validation.
 
-        Uses unique UUIDs per call to avoid name conflicts under concurrent load.
+        Names are made unique per attempt from the pid and a process-wide counter.
         Retries up to 3 times when GE's internal BytesIO buffer is closed prematurely
-        (a known transient error in ephemeral mode under parallel requests).
+        (a known transient error in ephemeral mode under parallel requests), backing off
+        exponentially with jitter so concurrent workers do not retry in lockstep.
         """
-        import uuid
-
         _TRANSIENT_MSGS = ("i/o operation on closed file", "closed file")
         _YAML_MSGS = ("nodeevent", "documentstartevent")
         MAX_RETRIES = 3
+        BASE_DELAY = 0.02  # seconds
+        MAX_DELAY = 0.5
+
+        def _backoff(attempt):
+            if attempt < MAX_RETRIES:
+                delay = BASE_DELAY * (2 ** (attempt - 1)) * (1 + random.random() * 0.5)
+                time.sleep(min(delay, MAX_DELAY))
 
         last_exc: Exception | None = None
 
         for attempt in range(1, MAX_RETRIES + 1):
-            uid = uuid.uuid4().hex[:10]
+            uid = f"{os.getpid():x}_{next(_data_source_seq):x}"
             try:
                 self.data_source = self.context.data_sources.add_pandas(f"src_{uid}")
                 self.data_asset = self.data_source.add_dataframe_asset(name=f"asset_{uid}")
@@ -97,6 +263,7 @@ class InstrumentValidator:
                         self.context = gx.get_context(mode="ephemeral")
                     except Exception as ctx_err:
                         logger.warning("[GE] Failed to recreate context: %s", ctx_err)
+                    _backoff(attempt)
                     continue  # retry with fresh context + new UUID
 
                 if any(tok in msg_lower for tok in _YAML_MSGS):
@@ -106,6 +273,7 @@ class InstrumentValidator:
                         self.context = gx.get_context(mode="ephemeral")
                     except Exception:
                         pass
+                    _backoff(attempt)
                     continue
 
                 # Any other error is not transient — surface immediately
@@ -116,41 +284,86 @@ class InstrumentValidator:
             f"(transient GE BytesIO error): {last_exc}"
         )
     
-    def _expand_rules_with_multiple_columns(self, rules):
+    @staticmethod
+    def _expectation_spec_from_rule(rule: CompiledRule, column):
         """
-        Expand rules that have comma-separated columns into multiple rules.
+        Return the (expectation class, params) spec for one column of a compiled rule.
+        
+        Specs are interned by rule content, so identical rules across exchanges,
+        product types and custom rule sets resolve once per process.
         
         Args:
-            rules: List of rule dictionaries
-            
-        Returns:
-            List of expanded rule dictionaries (one per column)
+            rule: CompiledRule to build the spec from
+            column: The column (one of rule.columns) the expectation applies to
+        
+        Raises:
+            ValueError: If the expectation type is not supported
+        """
+        try:
+            key = (_freeze_rule(rule), column)
+            spec = _interned_specs.get(key)
+        except TypeError:
+            # Unhashable values (e.g. sets in programmatic rules) are resolved uncached
+            return InstrumentValidator._resolve_expectation_spec(rule, column)
+        
+        if spec is None:
+            spec = InstrumentValidator._resolve_expectation_spec(rule, column)
+            if len(_interned_specs) >= _MAX_INTERNED_SPECS:
+                _interned_specs.clear()
+            _interned_specs[key] = spec
+        return spec
+    
+    @staticmethod
+    def _resolve_expectation_spec(rule: CompiledRule, column):
         """
-        expanded_rules = []
+        Resolve one column of a compiled rule into the expectation class and its constructor parameters.
         
-        for rule in rules:
-            if not isinstance(rule, dict) or 'column' not in rule:
-                expanded_rules.append(rule)
-                continue
+        Args:
+            rule: CompiledRule to resolve
+            column: The column the expectation applies to
             
-            column = rule.get('column', '')
+        Returns:
+            Tuple of (expectation class, parameter dict)
             
-            # Check if column contains comma-separated values
-            if ',' in column:
-                # Split by comma and strip whitespace
-                columns = [col.strip() for col in column.split(',')]
-                
-                # Create a rule for each column
-                for col in columns:
-                    if col:  # Skip empty columns
-                        expanded_rule = rule.copy()
-                        expanded_rule['column'] = col
-                        expanded_rules.append(expanded_rule)
-            else:
-                # Single column, keep as is
-                expanded_rules.append(rule)
+        Raises:
+            ValueError: If the expectation type is not supported
+        """
+        _import_great_expectations()
+        expectation_class = _EXPECTATION_TYPES.get(rule.type)
+        if expectation_class is None:
+            raise ValueError(
+                f"Unknown expectation type: {rule.type}. "
+                f"Supported types: {list(_EXPECTATION_TYPES.keys())}"
+            )
+        
+        # Build parameters for the expectation
+        params = {'column': column}
+        params.update({key: getattr(rule, key) for key in _OPTIONAL_PARAM_KEYS if getattr(rule, key) is not None})
+
+        # Support conditional rules: only validate rows where condition is true.
+        # Uses pandas query syntax, e.g. condition: "SecurityType == 'Bond'"
+        if rule.condition:
+            params['row_condition'] = rule.condition
+            params['condition_parser'] = 'pandas'
         
-        return expanded_rules
+        return expectation_class, params
+    
+    @staticmethod
+    def _instantiate_expectation(spec):
+        """
+        Build a fresh expectation object from a cached (class, params) spec.
+        
+        Expectations are bound to the suite they are added to, so every suite
+        gets its own instances even when the spec itself is shared.
+        
+        Raises:
+            ValueError: If the expectation cannot be constructed from the parameters
+        """
+        expectation_class, params = spec
+        try:
+            return expectation_class(**params)
+        except Exception as e:
+            raise ValueError(f"Failed to create expectation {expectation_class.__name__}: {e}")
     
     def _create_expectation_from_rule(self, rule: dict):
         """
@@ -165,58 +378,90 @@ class InstrumentValidator:
         Raises:
             ValueError: If rule is invalid or missing required fields
         """
-        if not isinstance(rule, dict):
-            raise ValueError(f"Rule must be a dictionary, got {type(rule)}")
-        
-        if 'type' not in rule:
-            raise ValueError("Rule must contain a 'type' field")
-        
-        expectation_type = rule['type']
-        column = rule.get('column')
+        compiled = CompiledRule.from_rule(rule)
+        return self._instantiate_expectation(self._expectation_spec_from_rule(compiled, rule['column']))
+    
+    def _get_expectation_specs(self, exchange, product_type, custom_rules, custom_rule_names, custom_only):
+        """
+        Return the expectation specs for a rule-set signature.
         
-        if not column:
-            raise ValueError(f"Rule must contain a 'column' field: {rule}")
+        Rules are loaded on every call, which is a stat per file while the parsed
+        YAML cache is warm. Compiling them into specs is memoized per signature and
+        reused only while no rules file has been parsed since the specs were built
+        (see parse_generation), so edited files are picked up on the next call.
+        Programmatic custom rules are part of the signature in frozen form; rule
+        sets holding unhashable values are built without the memo.
         
-        # Map expectation types to their classes
-        expectation_map = {
-            'ExpectColumnValuesToBeUnique': gxe.ExpectColumnValuesToBeUnique,
-            'ExpectColumnValuesToNotBeNull': gxe.ExpectColumnValuesToNotBeNull,
-            'ExpectColumnValuesToBeInSet': gxe.ExpectColumnValuesToBeInSet,
-            'ExpectColumnValuesToBeBetween': gxe.ExpectColumnValuesToBeBetween,
-            'ExpectColumnValuesToMatchRegex': gxe.ExpectColumnValuesToMatchRegex,
-        }
-        
-        if expectation_type not in expectation_map:
-            raise ValueError(
-                f"Unknown expectation type: {expectation_type}. "
-                f"Supported types: {list(expectation_map.keys())}"
+        An exchange or product type of None falls back to the one the validator
+        was created with.
+        """
+        exchange = exchange if exchange is not None else self.exchange
+        product_type = product_type if product_type is not None else self.product_type
+        generation = parse_generation()
+        rules = self._load_rules(exchange, product_type, custom_rules, custom_rule_names, custom_only)
+        try:
+            signature = (
+                str(self.rule_loader.rules_dir),
+                exchange,
+                product_type,
+                tuple(custom_rule_names) if custom_rule_names else None,
+                _freeze_rule(custom_rules) if custom_rules else None,
+                custom_only,
             )
+            entry = _spec_memo.get(signature)
+        except TypeError:
+            return _build_expectation_specs(rules)
+        
+        if entry is not None and entry[0] == parse_generation():
+            return entry[1]
+        specs = _build_expectation_specs(rules)
+        if len(_spec_memo) >= _MAX_SPEC_MEMO:
+            _spec_memo.clear()
+        # Stamped with the generation read before loading: a parse that raced the load invalidates it
+        _spec_memo[signature] = (generation, specs)
+        return specs
+    
+    def _load_rules(self, exchange, product_type, custom_rules, custom_rule_names, custom_only):
+        """Load the rule dictionaries for a rule-set signature, in application order."""
+        if custom_only:
+            rules = []
+            # Exchange-level custom rules override product type rules
+            if custom_rule_names:
+                rules.extend(self.rule_loader.load_custom_rules_from_yaml(
+                    custom_rule_names, product_type=product_type, exchange=exchange
+                ))
+            if custom_rules:
+                rules.extend(self.rule_loader.load_custom_rules(custom_rules))
+            return rules
+        return self.rule_loader.load_combined_rules(
+            exchange=exchange,
+            custom_rules=custom_rules,
+            custom_rule_names=custom_rule_names,
+            product_type=product_type
+        )
+    
+    @staticmethod
+    def clear_suite_cache():
+        """Drop cached expectation specs so the next validation rebuilds them (rule edits are picked up without it)."""
+        _spec_memo.clear()
+    
+    def _new_suite(self, suite_name):
+        """
+        Create a new, uniquely named expectation suite for one validation run.
         
-        expectation_class = expectation_map[expectation_type]
-        
-        # Build parameters for the expectation
-        params = {'column': column}
-        
-        # Add additional parameters based on expectation type
-        if 'value_set' in rule:
-            params['value_set'] = rule['value_set']
-        if 'min_value' in rule:
-            params['min_value'] = rule['min_value']
-        if 'max_value' in rule:
-            params['max_value'] = rule['max_value']
-        if 'regex' in rule:
-            params['regex'] = rule['regex']
-
-        # Support conditional rules: only validate rows where condition is true.
-        # Uses pandas query syntax, e.g. condition: "SecurityType == 'Bond'"
-        if 'condition' in rule and rule['condition']:
-            params['row_condition'] = rule['condition']
-            params['condition_parser'] = 'pandas'
+        The suite is not registered on the context: batch.validate() runs it
+        directly, and an unsaved suite skips GE's store round-trip for the suite
+        and for every expectation added to it. The name gets a process-wide
+        sequence suffix so results from concurrent runs stay distinguishable.
         
+        Raises:
+            ValueError: If GE refuses to create the suite
+        """
+        unique_suite_name = f"{suite_name}_{next(_suite_seq)}"
         try:
-            return expectation_class(**params)
+            return gx.ExpectationSuite(name=unique_suite_name)
         except Exception as e:
-            raise ValueError(f"Failed to create expectation {expectation_type}: {e}")
+            raise ValueError(f"Could not create expectation suite '{unique_suite_name}': {e}")
     
     def create_expectation_suite(self, suite_name="instruments_suite", exchange=None, custom_rules=None, custom_rule_names=None, product_type=None):
         """
@@ -233,45 +478,14 @@ class InstrumentValidator:
                              Rules are applied in order: base -> product_type/base -> exchange -> product_type/exchange -> custom (YAML) -> custom (programmatic)
             
         Returns:
-            ExpectationSuite: The configured expectation suite
+            ExpectationSuite: The configured expectation suite (not registered on the context)
         """
-        # Create suite, handling case where it might already exist
-        # Generate unique name if suite already exists to avoid conflicts
-        unique_suite_name = suite_name
-        counter = 1
-        while True:
-            try:
-                suite = self.context.suites.add(gx.ExpectationSuite(name=unique_suite_name))
-                break
-            except Exception:
-                # Suite with this name already exists, try with unique name
-                unique_suite_name = f"{suite_name}_{counter}"
-                counter += 1
-                if counter > 1000:  # Safety limit
-                    raise ValueError(f"Could not create unique suite name after {counter} attempts")
-        
-        # Use exchange parameter if provided, otherwise use instance exchange
-        exchange_to_use = exchange if exchange is not None else self.exchange
-        # Use product_type parameter if provided, otherwise use instance product_type
-        product_type_to_use = product_type if product_type is not None else self.product_type
-        
-        # Load combined rules: base + product_type/base + exchange + product_type/exchange + custom (YAML) + custom (programmatic)
-        rules = self.rule_loader.load_combined_rules(
-            exchange=exchange_to_use,
-            custom_rules=custom_rules,
-            custom_rule_names=custom_rule_names,
-            product_type=product_type_to_use
+        # Combined rules (base + product_type/base + exchange + product_type/exchange + custom (YAML)
+        # + custom (programmatic)), compiled and resolved once per rule-set signature
+        specs = self._get_expectation_specs(
+            exchange, product_type, custom_rules, custom_rule_names, custom_only=False
         )
-        
-        # Expand rules with comma-separated columns
-        expanded_rules = self._expand_rules_with_multiple_columns(rules)
-        
-        # Add each rule as an expectation
-        for rule in expanded_rules:
-            expectation = self._create_expectation_from_rule(rule)
-            suite.add_expectation(expectation)
-        
-        return suite
+        return self._suite_from_specs(suite_name, specs)
     
     def create_expectation_suite_custom_only(self, suite_name="instruments_suite", custom_rules=None, custom_rule_names=None, exchange=None, product_type=None):
         """
@@ -287,47 +501,21 @@ class InstrumentValidator:
                          If None, uses the product_type from initialization.
             
         Returns:
-            ExpectationSuite: The configured expectation suite with only custom rules
+            ExpectationSuite: The configured expectation suite with only custom rules (not registered on the context)
         """
-        # Create suite, handling case where it might already exist
-        unique_suite_name = suite_name
-        counter = 1
-        while True:
-            try:
-                suite = self.context.suites.add(gx.ExpectationSuite(name=unique_suite_name))
-                break
-            except Exception:
-                unique_suite_name = f"{suite_name}_{counter}"
-                counter += 1
-                if counter > 1000:
-                    raise ValueError(f"Could not create unique suite name after {counter} attempts")
-        
-        rules = []
-        
-        # Use product_type parameter if provided, otherwise use instance product_type
-        product_type_to_use = product_type if product_type is not None else self.product_type
-        
-        # Load custom rules from YAML by name (exchange-level rules override product type rules)
-        if custom_rule_names:
-            # Use exchange parameter if provided, otherwise use instance exchange
-            exchange_to_use = exchange if exchange is not None else self.exchange
-            yaml_custom_rules = self.rule_loader.load_custom_rules_from_yaml(
-                custom_rule_names, product_type=product_type_to_use, exchange=exchange_to_use
-            )
-            rules.extend(yaml_custom_rules)
-        
-        # Load programmatic custom rules
-        if custom_rules:
-            programmatic_custom = self.rule_loader.load_custom_rules(custom_rules)
-            rules.extend(programmatic_custom)
-        
-        # Expand rules with comma-separated columns
-        expanded_rules = self._expand_rules_with_multiple_columns(rules)
-        
-        # Add each rule as an expectation
-        for rule in expanded_rules:
-            expectation = self._create_expectation_from_rule(rule)
-            suite.add_expectation(expectation)
+        specs = self._get_expectation_specs(
+            exchange, product_type, custom_rules, custom_rule_names, custom_only=True
+        )
+        return self._suite_from_specs(suite_name, specs)
+    
+    def _suite_from_specs(self, suite_name, specs):
+        """Create a new suite holding a fresh expectation for each (expectation class, params) spec."""
+        with _ge_run_lock:
+            suite = self._new_suite(suite_name)
+            
+            # Add each rule as an expectation
+            for spec in specs:
+                suite.add_expectation(self._instantiate_expectation(spec))
         
         return suite
     
@@ -349,24 +537,29 @@ class InstrumentValidator:
         Returns:
             ValidationResult: The validation results
         """
-        t0 = time.perf_counter()
-        suite = self.create_expectation_suite(
-            suite_name,
-            exchange=exchange,
-            custom_rules=custom_rules,
-            custom_rule_names=custom_rule_names,
-            product_type=product_type,
+        # Timing is only measured when it will be logged
+        log_timing = logger.isEnabledFor(logging.INFO)
+        log_suite_timing = logger.isEnabledFor(logging.DEBUG)
+        t0 = time.perf_counter() if log_suite_timing else 0.0
+        specs = self._get_expectation_specs(
+            exchange, product_type, custom_rules, custom_rule_names, custom_only=False
         )
-        logger.debug("[TIMING] create_expectation_suite for %s/%s: %.1f ms",
-                     product_type or self.product_type, exchange or self.exchange,
-                     (time.perf_counter() - t0) * 1000)
-
-        t1 = time.perf_counter()
-        batch = self.batch_definition.get_batch(batch_parameters={"dataframe": df})
-        results = batch.validate(suite)
-        logger.info("[TIMING] GE batch.validate for %s/%s: %.1f ms (%d expectations)",
-                    product_type or self.product_type, exchange or self.exchange,
-                    (time.perf_counter() - t1) * 1000, len(suite.expectations))
+        if not specs:
+            return self._empty_validation_result(suite_name)
+        suite = self._suite_from_specs(suite_name, specs)
+        if log_suite_timing:
+            logger.debug("[TIMING] create_expectation_suite for %s/%s: %.1f ms",
+                         product_type or self.product_type, exchange or self.exchange,
+                         (time.perf_counter() - t0) * 1000)
+
+        t1 = time.perf_counter() if log_timing else 0.0
+        with _ge_run_lock:
+            batch = self.batch_definition.get_batch(batch_parameters={"dataframe": df})
+            results = batch.validate(suite)
+        if log_timing:
+            logger.info("[TIMING] GE batch.validate for %s/%s: %.1f ms (%d expectations)",
+                        product_type or self.product_type, exchange or self.exchange,
+                        (time.perf_counter() - t1) * 1000, len(specs))
         return results
     
     def validate_custom_only(self, df, suite_name="instruments_suite", custom_rules=None, custom_rule_names=None, exchange=None, product_type=None):
@@ -386,14 +579,183 @@ class InstrumentValidator:
         Returns:
             ValidationResult: The validation results
         """
-        suite = self.create_expectation_suite_custom_only(
-            suite_name, 
-            custom_rules=custom_rules,
-            custom_rule_names=custom_rule_names,
-            exchange=exchange,
-            product_type=product_type
+        specs = self._get_expectation_specs(
+            exchange, product_type, custom_rules, custom_rule_names, custom_only=True
         )
-        batch = self.batch_definition.get_batch(batch_parameters={"dataframe": df})
-        results = batch.validate(suite)
+        if not specs:
+            return self._empty_validation_result(suite_name)
+        
+        suite = self._suite_from_specs(suite_name, specs)
+        with _ge_run_lock:
+            batch = self.batch_definition.get_batch(batch_parameters={"dataframe": df})
+            return batch.validate(suite)
+    
+    def validate_many(self, df, configs):
+        """
+        Validate one dataframe against several rule sets, sharing a single batch.
+        
+        The specs of each config are resolved once and built into its own suite,
+        then every suite runs against the same batch, so the per-call batch setup
+        is paid once. Configs that resolve to no expectations get an empty
+        success result, as in validate().
+        
+        Args:
+            df: The dataframe to validate
+            configs: List of dicts of create_expectation_suite() keyword arguments
+                     (suite_name, exchange, custom_rules, custom_rule_names, product_type)
+            
+        Returns:
+            List of ValidationResult objects, one per config, in order
+        """
+        def resolve(suite_name="instruments_suite", exchange=None, custom_rules=None,
+                    custom_rule_names=None, product_type=None):
+            specs = self._get_expectation_specs(
+                exchange, product_type, custom_rules, custom_rule_names, custom_only=False
+            )
+            return suite_name, (self._suite_from_specs(suite_name, specs) if specs else None)
+        
+        runs = [resolve(**config) for config in configs]
+        
+        batch = None
+        results = []
+        with _ge_run_lock:
+            for suite_name, suite in runs:
+                if suite is None:
+                    results.append(self._empty_validation_result(suite_name))
+                    continue
+                if batch is None:
+                    batch = self.batch_definition.get_batch(batch_parameters={"dataframe": df})
+                results.append(batch.validate(suite))
         return results
+    
+    @staticmethod
+    def _empty_validation_result(suite_name):
+        """
+        Return a successful result with no expectation results, without touching GE's batch machinery.
+        
+        Used when a rule set resolves to no expectations, so there is nothing to run.
+        """
+        from great_expectations.core import ExpectationSuiteValidationResult
+        
+        return ExpectationSuiteValidationResult(
+            success=True,
+            results=[],
+            suite_name=suite_name,
+            statistics={
+                'evaluated_expectations': 0,
+                'successful_expectations': 0,
+                'unsuccessful_expectations': 0,
+                'success_percent': None,
+            },
+        )
+    
+    @staticmethod
+    def _refresh_suite_success(suite_result):
+        """Recompute a suite result's success flag and statistics from its expectation results."""
+        suite_result.success = all(result.success for result in suite_result.results)
+        
+        statistics = getattr(suite_result, 'statistics', None)
+        if isinstance(statistics, dict):
+            evaluated = len(suite_result.results)
+            successful = sum(1 for result in suite_result.results if result.success)
+            statistics.update(
+                evaluated_expectations=evaluated,
+                successful_expectations=successful,
+                unsuccessful_expectations=evaluated - successful,
+                success_percent=(successful / evaluated * 100) if evaluated else None,
+            )
+    
+    def validate_streaming(self, df_iter, suite_name="instruments_suite", **suite_kwargs):
+        """
+        Validate a dataframe delivered in chunks, so memory is bounded by the chunk size.
+        
+        The suite is built once and run against every chunk. Per expectation, the
+        counts (element, missing, unexpected) are summed, percentages recomputed and
+        success requires every chunk to pass. STREAMING_CHUNK_ROWS is a sensible
+        chunk size.
+        
+        Note that ExpectColumnValuesToBeUnique only sees one chunk at a time, so
+        duplicates split across chunks are not reported.
+        
+        Args:
+            df_iter: Iterable of dataframes, e.g. pd.read_csv(path, chunksize=STREAMING_CHUNK_ROWS)
+            suite_name: Name of the expectation suite to use
+            **suite_kwargs: create_expectation_suite() keyword arguments
+                            (exchange, custom_rules, custom_rule_names, product_type)
+            
+        Returns:
+            ValidationResult: The combined validation results
+        """
+        suite = self.create_expectation_suite(suite_name, **suite_kwargs)
+        if not suite.expectations:
+            return self._empty_validation_result(suite.name)
+        
+        combined = None
+        for chunk in df_iter:
+            # Held per chunk, so reading the next chunk does not block other validations
+            with _ge_run_lock:
+                batch = self.batch_definition.get_batch(batch_parameters={"dataframe": chunk})
+                chunk_results = batch.validate(suite)
+            if combined is None:
+                combined = chunk_results
+                continue
+            for total, part in zip(combined.results, chunk_results.results):
+                total.success = bool(total.success) and bool(part.success)
+                if isinstance(total.result, dict) and isinstance(part.result, dict):
+                    self._accumulate_result_counts(total.result, part.result)
+        
+        if combined is None:
+            return self._empty_validation_result(suite.name)
+        self._refresh_suite_success(combined)
+        return combined
+    
+    @staticmethod
+    def _accumulate_result_counts(total, part):
+        """Add one chunk's expectation result details into the running totals, in place."""
+        for key in ('element_count', 'missing_count', 'unexpected_count'):
+            if key in part:
+                total[key] = (total.get(key) or 0) + (part[key] or 0)
+        
+        element_count = total.get('element_count') or 0
+        missing_count = total.get('missing_count') or 0
+        unexpected_count = total.get('unexpected_count') or 0
+        nonmissing_count = element_count - missing_count
+        percentages = {
+            'missing_percent': (missing_count / element_count * 100) if element_count else None,
+            'unexpected_percent': (unexpected_count / nonmissing_count * 100) if nonmissing_count else None,
+            'unexpected_percent_total': (unexpected_count / element_count * 100) if element_count else None,
+            'unexpected_percent_nonmissing': (unexpected_count / nonmissing_count * 100) if nonmissing_count else None,
+        }
+        total.update({key: value for key, value in percentages.items() if key in total})
+        
+        for key in ('partial_unexpected_list', 'partial_unexpected_index_list'):
+            if isinstance(total.get(key), list) and isinstance(part.get(key), list):
+                room = _PARTIAL_UNEXPECTED_LIMIT - len(total[key])
+                if room > 0:
+                    total[key].extend(part[key][:room])
+        
+        if isinstance(total.get('partial_unexpected_counts'), list) and isinstance(part.get('partial_unexpected_counts'), list):
+            counts = {}
+            try:
+                for entry in total['partial_unexpected_counts'] + part['partial_unexpected_counts']:
+                    counts[entry['value']] = counts.get(entry['value'], 0) + entry['count']
+            except (KeyError, TypeError):
+                return
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            total['partial_unexpected_counts'] = [
+                {'value': value, 'count': count} for value, count in ranked[:_PARTIAL_UNEXPECTED_LIMIT]
+            ]
+
+
+def _build_expectation_specs(rules):
+    """
+    Compile and resolve loaded rules into expectation specs.
+    
+    Returns a tuple of (expectation class, params) specs, in rule declaration order.
+    """
+    return tuple(
+        InstrumentValidator._expectation_spec_from_rule(rule, column)
+        for rule in RuleLoader.compile_rules(rules)
+        for column in rule.columns
+    )
 
@@ -1,10 +1,226 @@
 """Loads validation rules from YAML configuration files."""
 
+import functools
+import itertools
 import logging
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    import yaml
+except ImportError:
+    raise ImportError(
+        "PyYAML is required for RuleLoader. Install it with: pip install pyyaml"
+    ) from None
+
+# YAML loader chosen once at import: the LibYAML-backed CSafeLoader when PyYAML was built
+# with it, else the pure-Python SafeLoader
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML content shared across loaders: absolute path -> (mtime_ns, size, content).
+# An entry is reused only while the file's mtime and size are unchanged.
+_parsed_yaml_cache = {}
+
+# Small thread pool for reading independent rule files concurrently (see _get_io_pool).
+_IO_POOL_WORKERS = 4
+_io_pool = None
+_io_pool_lock = threading.Lock()
+
+# Number of rules file parses so far in this process; see parse_generation()
+_parse_generation = 0
+_parse_generation_lock = threading.Lock()
+
+# Process-wide loaders handed out by RuleLoader.shared(), keyed by rules directory.
+_shared_loaders = {}
+_shared_loaders_lock = threading.Lock()
+
+# CompiledRule forms of rule dicts, keyed by id(rule) -> (rule, CompiledRule).
+# Cleared wholesale once it reaches _MAX_COMPILED_RULES.
+_compiled_rules = {}
+_MAX_COMPILED_RULES = 4096
+
+# Compiled ``regex`` rule patterns shared across loaders, keyed by pattern source.
+_compiled_patterns = {}
+
+
+def compile_rule_regex(pattern):
+    """
+    Return the compiled form of a rule's ``regex`` pattern.
+
+    Each distinct pattern is compiled once per process; later lookups are a dict hit.
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    compiled = _compiled_patterns.get(pattern)
+    if compiled is None:
+        compiled = re.compile(pattern)
+        _compiled_patterns[pattern] = compiled
+    return compiled
+
+
+def parse_generation():
+    """
+    Return a number that changes whenever a rules file is parsed, i.e. read for the first time or after an edit.
+    
+    Values derived from loaded rules can be memoized against it: read it before
+    loading the rules, and reuse the derived value while it is unchanged after a
+    later load. Reading it costs nothing; any parse in the process changes it.
+    """
+    return _parse_generation
+
+
+def _intern_strings(value):
+    """
+    Return *value* with every string key and value interned, recursively.
+    
+    Rule files repeat the same short strings ('type', 'column', column names, rule
+    types) many times; interning makes the copies share one object, so lookups
+    and comparisons on them hit the identity fast path. Applied once per parse.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_strings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+def _get_io_pool():
+    """Return the shared rule-file reader pool, creating it on first use."""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=_IO_POOL_WORKERS, thread_name_prefix="rule-loader-io"
+                )
+    return _io_pool
+
+
+def _cached_top_level_keys(file_path):
+    """
+    Return a file's top-level keys from the parsed-content cache, or None on a miss.
+    
+    Entries are only used while the file's mtime and size match the cached ones.
+    """
+    stat = os.stat(file_path)
+    cached = _parsed_yaml_cache.get(os.path.abspath(file_path))
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return list(cached[2].keys()) if isinstance(cached[2], dict) else []
+    return None
+
+
+# Files below this size are checked for being comments/whitespace only before parsing
+_EMPTY_CHECK_MAX_BYTES = 1024
+_YAML_COMMENT = re.compile(rb'(?m)#.*$')
+
+
+
+def _parse_yaml_file(file_path):
+    """
+    Parse a YAML file with the module's safe loader.
+    
+    Raises:
+        ValueError: If the file is not valid YAML
+    """
+    # Hand the raw bytes to the loader: LibYAML detects the encoding and decodes
+    # in C, so no intermediate str is built in Python
+    try:
+        data = Path(file_path).read_bytes()
+        # Placeholder files holding only comments/whitespace parse to None; skip the parser
+        if len(data) < _EMPTY_CHECK_MAX_BYTES and not _YAML_COMMENT.sub(b'', data).strip():
+            return None
+        return yaml.load(data, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"YAML parsing error in {file_path}: {str(e)}")
+    except Exception as e:
+        raise Exception(f"Error reading YAML file {file_path}: {str(e)}")
+
+
+class CompiledRule(NamedTuple):
+    """A rule validated and normalized once, ready to be turned into expectations.
+    
+    Rule dictionaries stay the public format (they are returned by the API);
+    this is the internal form the validator builds suites from. Optional fields
+    are None when the rule does not set them.
+    """
+    type: str
+    columns: tuple
+    value_set: Optional[Any] = None
+    min_value: Optional[Any] = None
+    max_value: Optional[Any] = None
+    regex: Optional[str] = None
+    condition: Optional[str] = None
+    
+    @classmethod
+    def from_rule(cls, rule):
+        """
+        Validate a rule dictionary and normalize it into a CompiledRule.
+        
+        Comma-separated columns are split into ``columns``, so multi-column rules
+        need no further expansion.
+        
+        Args:
+            rule: Dictionary containing expectation type and parameters
+            
+        Returns:
+            CompiledRule: The normalized rule
+            
+        Raises:
+            ValueError: If rule is invalid, missing required fields, or has an invalid regex
+        """
+        if not isinstance(rule, dict):
+            raise ValueError(f"Rule must be a dictionary, got {type(rule)}")
+        
+        if 'type' not in rule:
+            raise ValueError("Rule must contain a 'type' field")
+        
+        column = rule.get('column')
+        if not column:
+            raise ValueError(f"Rule must contain a 'column' field: {rule}")
+        
+        # Column names and value-set strings are interned: GE uses them as dict keys and
+        # compares them repeatedly, and interned strings compare by identity first
+        if not isinstance(column, str):
+            columns = (column,)
+        elif ',' in column:
+            columns = tuple(sys.intern(col) for col in map(str.strip, column.split(',')) if col)
+        else:
+            columns = (sys.intern(column),)
+        
+        value_set = rule.get('value_set')
+        if isinstance(value_set, list):
+            value_set = [sys.intern(value) if type(value) is str else value for value in value_set]
+        
+        regex = rule.get('regex')
+        if regex is not None:
+            try:
+                compile_rule_regex(regex)
+            except (re.error, TypeError) as e:
+                raise ValueError(f"Invalid regex in rule {rule}: {e}")
+        
+        return cls(
+            type=rule['type'],
+            columns=columns,
+            value_set=value_set,
+            min_value=rule.get('min_value'),
+            max_value=rule.get('max_value'),
+            regex=regex,
+            condition=rule.get('condition') or None,
+        )
+
 
 class RuleLoader:
     """Loads and parses validation rules from YAML files.
@@ -25,15 +241,62 @@ class RuleLoader:
         self._config = None
         self._use_modular = self._detect_modular_structure()
     
+    @classmethod
+    def shared(cls, rules_dir=None):
+        """
+        Return the process-wide loader for *rules_dir*, creating it on first use.
+        
+        Request paths should use this instead of the constructor: one loader per
+        rules directory serves every caller, and parsed YAML is already cached per
+        file, so warm requests never touch the parser.
+        
+        Args:
+            rules_dir: Path to the modular rules directory (default: "config/rules/")
+            
+        Returns:
+            RuleLoader: The shared loader
+        """
+        key = str(Path(rules_dir) if rules_dir else Path("config/rules"))
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            with _shared_loaders_lock:
+                loader = _shared_loaders.get(key)
+                if loader is None:
+                    loader = cls(rules_dir=key)
+                    _shared_loaders[key] = loader
+        return loader
+    
     def _detect_modular_structure(self):
         """Detect if modular rules structure exists."""
         base_file = self.rules_dir / "base.yaml"
         return base_file.exists()
     
+    def _yaml_stems(self, dir_path):
+        """
+        List the names (without extension) of the ``*.yaml`` files directly in *dir_path*.
+        
+        Uses a single os.scandir pass; callers should check that the directory exists.
+        
+        Args:
+            dir_path: Directory inside rules_dir
+            
+        Returns:
+            List of file stems, in directory order
+        """
+        stems = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if os.path.normcase(entry.name).endswith('.yaml') and entry.is_file():
+                    stems.append(entry.name[:-5])
+        return stems
+    
     def _load_yaml_file(self, file_path, allow_empty=False):
         """
         Load a YAML file.
         
+        Parsed content is cached per file and reused until the file's mtime or size
+        changes, so callers must treat the returned objects as read-only.
+        
         Args:
             file_path: Path to the YAML file
             allow_empty: If True, return None for empty files instead of raising an error
@@ -45,28 +308,23 @@ class RuleLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If file is empty and allow_empty=False
         """
-        try:
-            import yaml
-        except ImportError:
-            raise ImportError(
-                "PyYAML is required for RuleLoader. Install it with: pip install pyyaml"
-            )
+        global _parse_generation
         
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"YAML file not found: {file_path}")
         
-        # Use explicit file handle management to avoid conflicts
-        # Read file content first, then parse to avoid file handle issues
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-            
-            # Parse YAML from string content (avoids file handle issues)
-            content = yaml.safe_load(file_content)
-        except yaml.YAMLError as e:
-            raise ValueError(f"YAML parsing error in {file_path}: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Error reading YAML file {file_path}: {str(e)}")
+        # Reuse the parsed content while the file is unchanged on disk
+        cache_key = os.path.abspath(file_path)
+        cached = _parsed_yaml_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            content = cached[2]
+        else:
+            content = _intern_strings(_parse_yaml_file(file_path))
+            _parsed_yaml_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, content)
+            with _parse_generation_lock:
+                _parse_generation += 1
         
         if content is None:
             if allow_empty:
@@ -75,6 +333,23 @@ class RuleLoader:
         
         return content
     
+    def _list_top_level_keys(self, file_path):
+        """
+        Return the top-level mapping keys of a YAML file.
+        
+        Used to enumerate rule set names. The keys are those of the parsed
+        content, so they match what rule lookups see (non-string and merge keys
+        included); the parse is cached per file.
+        
+        Args:
+            file_path: Path to the YAML file
+            
+        Returns:
+            List of top-level keys, or an empty list if the document is not a mapping
+        """
+        config = self._load_yaml_file(file_path, allow_empty=True)
+        return list(config.keys()) if isinstance(config, dict) else []
+    
     def _load_config(self):
         """Load and cache YAML configuration (for backward compatibility)."""
         if self._config is None:
@@ -179,11 +454,8 @@ class RuleLoader:
             if not exchanges_dir.exists():
                 return []
             
-            exchanges = []
-            for file in exchanges_dir.glob("*.yaml"):
-                # Extract exchange code from filename (e.g., hkg.yaml -> HKG)
-                exchange_code = file.stem.upper()
-                exchanges.append(exchange_code)
+            # Extract exchange codes from filenames (e.g., hkg.yaml -> HKG)
+            exchanges = [stem.upper() for stem in self._yaml_stems(exchanges_dir)]
             
             return sorted(exchanges)
         else:
@@ -219,55 +491,15 @@ class RuleLoader:
         Returns:
             Custom rule set dictionary or None if not found
         """
-        # Try exchange-level custom.yaml first (highest priority - overrides product type)
-        if exchange and product_type:
-            normalized_type = self._normalize_product_type(product_type)
-            exchange_custom_yaml_file = (
-                self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "custom.yaml"
-            )
-            if exchange_custom_yaml_file.exists():
-                custom_config = self._load_yaml_file(exchange_custom_yaml_file, allow_empty=True)
-                if custom_config and isinstance(custom_config, dict) and rule_name in custom_config:
-                    return custom_config[rule_name]
-            
-            # Try exchange-level combined.yaml
-            exchange_combined_yaml_file = (
-                self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "combined.yaml"
-            )
-            if exchange_combined_yaml_file.exists():
-                combined_config = self._load_yaml_file(exchange_combined_yaml_file, allow_empty=True)
-                if combined_config and isinstance(combined_config, dict) and rule_name in combined_config:
-                    return combined_config[rule_name]
-        
-        # Try product type-specific custom.yaml file (if product_type is specified)
-        if product_type:
-            normalized_type = self._normalize_product_type(product_type)
-            product_custom_yaml_file = self.rules_dir / normalized_type / "custom.yaml"
-            if product_custom_yaml_file.exists():
-                custom_config = self._load_yaml_file(product_custom_yaml_file, allow_empty=True)
-                if custom_config and isinstance(custom_config, dict) and rule_name in custom_config:
-                    return custom_config[rule_name]
-            
-            # Try product type-specific combined.yaml file
-            product_combined_yaml_file = self.rules_dir / normalized_type / "combined.yaml"
-            if product_combined_yaml_file.exists():
-                combined_config = self._load_yaml_file(product_combined_yaml_file, allow_empty=True)
-                if combined_config and isinstance(combined_config, dict) and rule_name in combined_config:
-                    return combined_config[rule_name]
-        
-        # Try custom.yaml file (root level)
-        custom_yaml_file = self.rules_dir / "custom.yaml"
-        if custom_yaml_file.exists():
-            custom_config = self._load_yaml_file(custom_yaml_file, allow_empty=True)
-            if custom_config and isinstance(custom_config, dict) and rule_name in custom_config:
-                return custom_config[rule_name]
-        
-        # Try combined.yaml file (root level)
-        combined_yaml_file = self.rules_dir / "combined.yaml"
-        if combined_yaml_file.exists():
-            combined_config = self._load_yaml_file(combined_yaml_file, allow_empty=True)
-            if combined_config and isinstance(combined_config, dict) and rule_name in combined_config:
-                return combined_config[rule_name]
+        # Exchange, product type and root custom.yaml / combined.yaml files, in priority order
+        for search_dir in self._custom_search_dirs(product_type, exchange):
+            for file_name in ("custom.yaml", "combined.yaml"):
+                source_file = search_dir / file_name
+                if not source_file.exists():
+                    continue
+                config = self._load_yaml_file(source_file, allow_empty=True)
+                if config and isinstance(config, dict) and rule_name in config:
+                    return config[rule_name]
         
         # Try custom/ directory (for backward compatibility)
         custom_file = self.rules_dir / "custom" / f"{rule_name}.yaml"
@@ -281,37 +513,21 @@ class RuleLoader:
         
         return None
     
-    def _resolve_custom_rule_set(self, rule_name, visited=None, product_type=None, exchange=None):
+    def _lookup_custom_rule_set(self, rule_name, product_type=None, exchange=None):
         """
-        Recursively resolve a custom rule set, handling includes and preventing circular references.
+        Return the raw definition of a custom rule set (a list, or a dict with 'include').
         
-        Args:
-            rule_name: Name of the custom rule set to resolve
-            visited: Set of rule names already visited (to prevent circular references)
-            product_type: Optional product type to load product type-specific custom rules
-            exchange: Optional exchange code to load exchange-specific custom rules (overrides product type rules)
-            
-        Returns:
-            List of resolved rule dictionaries
-            
         Raises:
-            ValueError: If rule not found or circular reference detected
+            ValueError: If the rule set is not found
         """
-        if visited is None:
-            visited = set()
-        
-        if rule_name in visited:
-            raise ValueError(f"Circular reference detected in custom rule set '{rule_name}'")
-        
-        visited.add(rule_name)
-        
         # Try modular structure first
         if self._use_modular:
             rule_set = self._load_custom_rule_file(rule_name, product_type=product_type, exchange=exchange)
             if rule_set is None:
                 # Include both custom and combined rules in the error message
-                available_custom = self.get_available_custom_rule_sets(product_type=product_type, exchange=exchange)
-                available_combined = self.get_available_combined_rule_sets(product_type=product_type, exchange=exchange)
+                available_custom, available_combined = self._scan_available_rule_sets(
+                    product_type=product_type, exchange=exchange
+                )
                 all_available = sorted(set(available_custom + available_combined))
                 raise ValueError(
                     f"Custom rule set '{rule_name}' not found. "
@@ -319,68 +535,108 @@ class RuleLoader:
                     f"Available combined rule sets: {available_combined}. "
                     f"All available: {all_available}"
                 )
-        else:
-            # Load from single file (backward compatibility)
-            config = self._load_config()
+            return rule_set
+        
+        # Load from single file (backward compatibility)
+        config = self._load_config()
+        
+        if 'custom_rules' not in config:
+            raise ValueError("No custom_rules section found in configuration")
+        
+        if rule_name not in config['custom_rules']:
+            raise ValueError(
+                f"Custom rule set '{rule_name}' not found. "
+                f"Available custom rule sets: {list(config['custom_rules'].keys())}"
+            )
+        
+        return config['custom_rules'][rule_name]
+    
+    def _resolve_custom_rule_set(self, rule_name, visited=None, product_type=None, exchange=None):
+        """
+        Resolve a custom rule set, handling includes and preventing circular references.
+        
+        Includes are resolved depth-first with an explicit stack rather than recursion.
+        
+        Args:
+            rule_name: Name of the custom rule set to resolve
+            visited: Optional set of rule names already on the include path (treated as
+                circular if included again)
+            product_type: Optional product type to load product type-specific custom rules
+            exchange: Optional exchange code to load exchange-specific custom rules (overrides product type rules)
             
-            if 'custom_rules' not in config:
-                raise ValueError("No custom_rules section found in configuration")
+        Returns:
+            List of resolved rule dictionaries. A plain rule set is returned as loaded
+            (shared with the YAML cache), so callers must copy it before mutating.
             
-            if rule_name not in config['custom_rules']:
-                raise ValueError(
-                    f"Custom rule set '{rule_name}' not found. "
-                    f"Available custom rule sets: {list(config['custom_rules'].keys())}"
-                )
+        Raises:
+            ValueError: If rule not found or circular reference detected
+        """
+        on_path = set(visited) if visited else set()
+        # Frames of [name, rule_set, include names, next include index, resolved parts]
+        stack = []
+        
+        def enter(name):
+            """Return a plain rule list, or push a frame for an include set and return None."""
+            if name in on_path:
+                raise ValueError(f"Circular reference detected in custom rule set '{name}'")
+            rule_set = self._lookup_custom_rule_set(name, product_type=product_type, exchange=exchange)
             
-            rule_set = config['custom_rules'][rule_name]
-        
-        # Handle rule set with 'include' key (combining other rules)
-        if isinstance(rule_set, dict) and 'include' in rule_set:
-            rules = []
-            
-            # Resolve included rule sets
-            if isinstance(rule_set['include'], list):
-                for included_rule_name in rule_set['include']:
-                    try:
-                        included_rules = self._resolve_custom_rule_set(
-                            included_rule_name, visited.copy(), product_type=product_type, exchange=exchange
-                        )
-                        rules.extend(included_rules)
-                    except ValueError as e:
-                        # Provide more context about which included rule failed
-                        raise ValueError(
-                            f"Error resolving included rule '{included_rule_name}' in '{rule_name}': {str(e)}"
-                        )
-            elif isinstance(rule_set['include'], str):
-                try:
-                    included_rules = self._resolve_custom_rule_set(
-                        rule_set['include'], visited.copy(), product_type=product_type, exchange=exchange
-                    )
-                    rules.extend(included_rules)
-                except ValueError as e:
-                    # Provide more context about which included rule failed
-                    raise ValueError(
-                        f"Error resolving included rule '{rule_set['include']}' in '{rule_name}': {str(e)}"
-                    )
-            
-            # Add any additional direct rules after includes
-            # Look for list items that are not the 'include' key
-            for key, value in rule_set.items():
-                if key != 'include':
-                    if isinstance(value, list):
-                        # This handles the case where rules are defined as a list under a key
-                        rules.extend(value)
-                    elif isinstance(value, dict) and 'type' in value:
-                        # This handles individual rule dictionaries
-                        rules.append(value)
+            # Rule set with 'include' key (combining other rules)
+            if isinstance(rule_set, dict) and 'include' in rule_set:
+                include = rule_set['include']
+                if isinstance(include, list):
+                    includes = include
+                elif isinstance(include, str):
+                    includes = [include]
+                else:
+                    includes = []
+                on_path.add(name)
+                stack.append([name, rule_set, includes, 0, []])
+                return None
             
-            return rules
+            # Regular list of rules; shared with the YAML cache
+            if not isinstance(rule_set, list):
+                raise ValueError(f"Custom rule set '{name}' must be a list or dict with 'include' key")
+            return rule_set
         
-        # Handle regular list of rules
-        if not isinstance(rule_set, list):
-            raise ValueError(f"Custom rule set '{rule_name}' must be a list or dict with 'include' key")
+        try:
+            result = enter(rule_name)
+            while stack:
+                frame = stack[-1]
+                name, rule_set, includes, index, parts = frame
+                
+                # Resolve the next included rule set, descending into it if needed
+                if index < len(includes):
+                    frame[3] = index + 1
+                    included_rules = enter(includes[index])
+                    if included_rules is not None:
+                        parts.append(included_rules)
+                    continue
+                
+                # All includes done: flatten them, then add any direct rules after includes
+                # (lists of rules under other keys, and individual rule dictionaries)
+                stack.pop()
+                on_path.discard(name)
+                rules = list(itertools.chain.from_iterable(parts))
+                if len(rule_set) > 1:
+                    rules.extend(itertools.chain.from_iterable(
+                        value if isinstance(value, list) else (value,)
+                        for key, value in rule_set.items()
+                        if key != 'include'
+                        and (isinstance(value, list) or (isinstance(value, dict) and 'type' in value))
+                    ))
+                if stack:
+                    stack[-1][4].append(rules)
+                else:
+                    result = rules
+        except ValueError as e:
+            # Provide context about which included rule failed, innermost include first
+            message = str(e)
+            for name, _rule_set, includes, index, _parts in reversed(stack):
+                message = f"Error resolving included rule '{includes[index - 1]}' in '{name}': {message}"
+            raise ValueError(message)
         
-        return rule_set.copy()
+        return result
     
     def load_custom_rules_from_yaml(self, custom_rule_names=None, product_type=None, exchange=None):
         """
@@ -411,6 +667,86 @@ class RuleLoader:
         
         return rules
     
+    def _custom_search_dirs(self, product_type=None, exchange=None):
+        """
+        Return the directories searched for custom.yaml / combined.yaml, highest priority first.
+        
+        Exchange level (only with a product type), then product type, then root level.
+        """
+        normalized_type = self._normalize_product_type(product_type)
+        search_dirs = []
+        if exchange and product_type:
+            search_dirs.append(self.rules_dir / normalized_type / "exchanges" / exchange.lower())
+        if product_type:
+            search_dirs.append(self.rules_dir / normalized_type)
+        search_dirs.append(self.rules_dir)
+        return search_dirs
+    
+    def _read_top_level_keys(self, file_paths):
+        """
+        Return the top-level keys of each file in *file_paths*, in the same order.
+        
+        Files already in the parsed-content cache are answered inline. When more
+        than one file needs parsing, the reads run concurrently on the shared I/O
+        pool: they are independent and mostly spent in file I/O and the LibYAML
+        parser.
+        """
+        results = [_cached_top_level_keys(path) for path in file_paths]
+        missing = [i for i, keys in enumerate(results) if keys is None]
+        if len(missing) > 1:
+            loaded = _get_io_pool().map(self._list_top_level_keys, [file_paths[i] for i in missing])
+            for i, keys in zip(missing, loaded):
+                results[i] = keys
+        else:
+            for i in missing:
+                results[i] = self._list_top_level_keys(file_paths[i])
+        return results
+    
+    def _scan_available_rule_sets(self, product_type=None, exchange=None):
+        """
+        Collect custom and combined rule set names from the modular structure in one pass.
+        
+        Each custom.yaml / combined.yaml file and backward-compatible directory is read
+        once; names from combined sources are reported in both lists.
+        
+        Args:
+            product_type: Optional product type to include product type-specific rule sets
+            exchange: Optional exchange code to include exchange-specific rule sets
+            
+        Returns:
+            Tuple of (custom rule set names, combined rule set names), each sorted and
+            without duplicates
+        """
+        custom_only = []
+        combined = []
+        custom_files = []
+        combined_files = []
+        for search_dir in self._custom_search_dirs(product_type, exchange):
+            custom_yaml_file = search_dir / "custom.yaml"
+            if custom_yaml_file.exists():
+                custom_files.append(custom_yaml_file)
+            
+            combined_yaml_file = search_dir / "combined.yaml"
+            if combined_yaml_file.exists():
+                combined_files.append(combined_yaml_file)
+        
+        file_keys = self._read_top_level_keys(custom_files + combined_files)
+        for keys in file_keys[:len(custom_files)]:
+            custom_only.extend(keys)
+        for keys in file_keys[len(custom_files):]:
+            combined.extend(keys)
+        
+        # custom/ and custom/combined/ directories (for backward compatibility)
+        custom_dir = self.rules_dir / "custom"
+        if custom_dir.exists():
+            custom_only.extend(self._yaml_stems(custom_dir))
+            
+            combined_dir = custom_dir / "combined"
+            if combined_dir.exists():
+                combined.extend(self._yaml_stems(combined_dir))
+        
+        return sorted(set(custom_only).union(combined)), sorted(set(combined))
+    
     def get_available_custom_rule_sets(self, product_type=None, exchange=None):
         """
         Get list of available custom rule set names.
@@ -424,69 +760,7 @@ class RuleLoader:
             List of custom rule set names
         """
         if self._use_modular:
-            rule_sets = []
-            
-            # Get rules from exchange-level custom.yaml first (highest priority)
-            if exchange and product_type:
-                normalized_type = self._normalize_product_type(product_type)
-                exchange_custom_yaml_file = (
-                    self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "custom.yaml"
-                )
-                if exchange_custom_yaml_file.exists():
-                    custom_config = self._load_yaml_file(exchange_custom_yaml_file, allow_empty=True)
-                    if isinstance(custom_config, dict):
-                        rule_sets.extend(custom_config.keys())
-                
-                exchange_combined_yaml_file = (
-                    self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "combined.yaml"
-                )
-                if exchange_combined_yaml_file.exists():
-                    combined_config = self._load_yaml_file(exchange_combined_yaml_file, allow_empty=True)
-                    if isinstance(combined_config, dict):
-                        rule_sets.extend(combined_config.keys())
-            
-            # Get rules from product type-specific custom.yaml file (if product_type is specified)
-            if product_type:
-                normalized_type = self._normalize_product_type(product_type)
-                product_custom_yaml_file = self.rules_dir / normalized_type / "custom.yaml"
-                if product_custom_yaml_file.exists():
-                    custom_config = self._load_yaml_file(product_custom_yaml_file, allow_empty=True)
-                    if isinstance(custom_config, dict):
-                        rule_sets.extend(custom_config.keys())
-                
-                product_combined_yaml_file = self.rules_dir / normalized_type / "combined.yaml"
-                if product_combined_yaml_file.exists():
-                    combined_config = self._load_yaml_file(product_combined_yaml_file, allow_empty=True)
-                    if isinstance(combined_config, dict):
-                        rule_sets.extend(combined_config.keys())
-            
-            # Get rules from custom.yaml file (root level)
-            custom_yaml_file = self.rules_dir / "custom.yaml"
-            if custom_yaml_file.exists():
-                custom_config = self._load_yaml_file(custom_yaml_file, allow_empty=True)
-                if isinstance(custom_config, dict):
-                    rule_sets.extend(custom_config.keys())
-            
-            # Get rules from combined.yaml file (root level)
-            combined_yaml_file = self.rules_dir / "combined.yaml"
-            if combined_yaml_file.exists():
-                combined_config = self._load_yaml_file(combined_yaml_file, allow_empty=True)
-                if isinstance(combined_config, dict):
-                    rule_sets.extend(combined_config.keys())
-            
-            # Get rules from custom/ directory (for backward compatibility)
-            custom_dir = self.rules_dir / "custom"
-            if custom_dir.exists():
-                for file in custom_dir.glob("*.yaml"):
-                    rule_sets.append(file.stem)
-                
-                # Get rules from custom/combined/ directory (for backward compatibility)
-                combined_dir = custom_dir / "combined"
-                if combined_dir.exists():
-                    for file in combined_dir.glob("*.yaml"):
-                        rule_sets.append(file.stem)
-            
-            return sorted(set(rule_sets))  # Remove duplicates
+            return self._scan_available_rule_sets(product_type, exchange)[0]
         else:
             # Load from single file (backward compatibility)
             config = self._load_config()
@@ -512,42 +786,7 @@ class RuleLoader:
             List of combined rule set names
         """
         if self._use_modular:
-            combined_rule_sets = []
-            
-            # Get rules from exchange-level combined.yaml first (highest priority)
-            if exchange and product_type:
-                normalized_type = self._normalize_product_type(product_type)
-                exchange_combined_yaml_file = (
-                    self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "combined.yaml"
-                )
-                if exchange_combined_yaml_file.exists():
-                    combined_config = self._load_yaml_file(exchange_combined_yaml_file, allow_empty=True)
-                    if isinstance(combined_config, dict):
-                        combined_rule_sets.extend(combined_config.keys())
-            
-            # Get rules from product type-specific combined.yaml file (if product_type is specified)
-            if product_type:
-                normalized_type = self._normalize_product_type(product_type)
-                product_combined_yaml_file = self.rules_dir / normalized_type / "combined.yaml"
-                if product_combined_yaml_file.exists():
-                    combined_config = self._load_yaml_file(product_combined_yaml_file, allow_empty=True)
-                    if isinstance(combined_config, dict):
-                        combined_rule_sets.extend(combined_config.keys())
-            
-            # Get rules from combined.yaml file (root level)
-            combined_yaml_file = self.rules_dir / "combined.yaml"
-            if combined_yaml_file.exists():
-                combined_config = self._load_yaml_file(combined_yaml_file, allow_empty=True)
-                if isinstance(combined_config, dict):
-                    combined_rule_sets.extend(combined_config.keys())
-            
-            # Get rules from custom/combined/ directory (for backward compatibility)
-            combined_dir = self.rules_dir / "custom" / "combined"
-            if combined_dir.exists():
-                for file in combined_dir.glob("*.yaml"):
-                    combined_rule_sets.append(file.stem)
-            
-            return sorted(set(combined_rule_sets))  # Remove duplicates
+            return self._scan_available_rule_sets(product_type, exchange)[1]
         else:
             # Load from single file (backward compatibility)
             config = self._load_config()
@@ -578,10 +817,13 @@ class RuleLoader:
         
         return custom_rules
     
-    def _normalize_product_type(self, product_type):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _normalize_product_type(product_type):
         """
         Normalize product type to match folder names.
         Converts 'stocks' -> 'stock', 'option' -> 'options', etc.
+        Memoized: callers pass the same handful of product types on every request.
         """
         if not product_type:
             return None
@@ -635,10 +877,10 @@ class RuleLoader:
             return []
         
         normalized_type = self._normalize_product_type(product_type)
+        exchanges_dir = self.rules_dir / normalized_type / "exchanges"
+        exchange_code = exchange.lower()
         # New structure: stock/exchanges/xhkg/exchange.yaml
-        product_type_exchange_file = (
-            self.rules_dir / normalized_type / "exchanges" / exchange.lower() / "exchange.yaml"
-        )
+        product_type_exchange_file = exchanges_dir / exchange_code / "exchange.yaml"
         if product_type_exchange_file.exists():
             rules = self._load_yaml_file(product_type_exchange_file, allow_empty=True)
             if rules is None:
@@ -649,7 +891,7 @@ class RuleLoader:
             return rules
         
         # Fallback to old structure for backward compatibility: stock/exchanges/xhkg.yaml
-        old_product_type_exchange_file = self.rules_dir / normalized_type / "exchanges" / f"{exchange.lower()}.yaml"
+        old_product_type_exchange_file = exchanges_dir / f"{exchange_code}.yaml"
         if old_product_type_exchange_file.exists():
             rules = self._load_yaml_file(old_product_type_exchange_file, allow_empty=True)
             if rules is None:
@@ -674,28 +916,36 @@ class RuleLoader:
             Combined list of rule dictionaries in order: 
             base -> product_type/base -> exchange -> product_type/exchange -> custom (YAML) -> custom (programmatic)
         """
-        rules = self.load_base_rules()
-        logger.debug("Loaded %d base rules", len(rules))
+        # Collect the per-source lists, then build the result once; the loaded lists are
+        # shared through the YAML cache and must not be extended in place
+        debug = logger.isEnabledFor(logging.DEBUG)
+        base_rules = self.load_base_rules()
+        parts = [base_rules]
+        if debug:
+            logger.debug("Loaded %d base rules", len(base_rules))
 
         if product_type:
             try:
                 product_type_rules = self.load_product_type_rules(product_type)
-                rules.extend(product_type_rules)
-                logger.debug("Loaded %d product-type rules for %s", len(product_type_rules), product_type)
+                parts.append(product_type_rules)
+                if debug:
+                    logger.debug("Loaded %d product-type rules for %s", len(product_type_rules), product_type)
             except (ValueError, FileNotFoundError):
                 pass
 
         if exchange:
             exchange_rules = self.load_exchange_rules(exchange)
-            rules.extend(exchange_rules)
-            logger.debug("Loaded %d root-exchange rules for %s", len(exchange_rules), exchange)
+            parts.append(exchange_rules)
+            if debug:
+                logger.debug("Loaded %d root-exchange rules for %s", len(exchange_rules), exchange)
 
         if product_type and exchange:
             try:
                 product_type_exchange_rules = self.load_product_type_exchange_rules(product_type, exchange)
-                rules.extend(product_type_exchange_rules)
-                logger.debug("Loaded %d product-type/exchange rules for %s/%s",
-                             len(product_type_exchange_rules), product_type, exchange)
+                parts.append(product_type_exchange_rules)
+                if debug:
+                    logger.debug("Loaded %d product-type/exchange rules for %s/%s",
+                                 len(product_type_exchange_rules), product_type, exchange)
             except (ValueError, FileNotFoundError):
                 pass
 
@@ -703,17 +953,69 @@ class RuleLoader:
             yaml_custom_rules = self.load_custom_rules_from_yaml(
                 custom_rule_names, product_type=product_type, exchange=exchange
             )
-            rules.extend(yaml_custom_rules)
-            logger.debug("Loaded %d custom YAML rules (%s)", len(yaml_custom_rules), custom_rule_names)
+            parts.append(yaml_custom_rules)
+            if debug:
+                logger.debug("Loaded %d custom YAML rules (%s)", len(yaml_custom_rules), custom_rule_names)
 
         if custom_rules:
             programmatic_custom = self.load_custom_rules(custom_rules)
-            rules.extend(programmatic_custom)
-            logger.debug("Loaded %d programmatic custom rules", len(programmatic_custom))
+            parts.append(programmatic_custom)
+            if debug:
+                logger.debug("Loaded %d programmatic custom rules", len(programmatic_custom))
+
+        rules = list(itertools.chain.from_iterable(parts))
+
+        self._precompile_patterns(rules)
 
         logger.info("Combined rules for %s/%s: %d total", product_type or "-", exchange or "-", len(rules))
         return rules
     
+    def _precompile_patterns(self, rules):
+        """
+        Compile every ``regex`` pattern in *rules* up front.
+
+        Invalid patterns fail here, at load time, instead of inside the validation run.
+
+        Raises:
+            ValueError: If a rule contains an invalid regex
+        """
+        for rule in rules:
+            if isinstance(rule, dict) and 'regex' in rule:
+                try:
+                    compile_rule_regex(rule['regex'])
+                except re.error as e:
+                    raise ValueError(f"Invalid regex in rule {rule}: {e}")
+    
+    @staticmethod
+    def compile_rules(rules):
+        """
+        Normalize loaded rule dictionaries into CompiledRule tuples.
+        
+        Args:
+            rules: List of rule dictionaries, as returned by the load_* methods
+            
+        Each rule dict is normalized once per process; rule dicts must not be mutated
+        after they have been compiled.
+        
+        Returns:
+            List of CompiledRule objects, in the same order
+            
+        Raises:
+            ValueError: If any rule is invalid
+        """
+        compiled_rules = []
+        for rule in rules:
+            # Loaded rule dicts are shared read-only through the YAML cache, so each one
+            # is normalized once; the entry keeps the dict alive so its id is not reused
+            entry = _compiled_rules.get(id(rule))
+            if entry is None or entry[0] is not rule:
+                entry = (rule, CompiledRule.from_rule(rule))
+                if len(_compiled_rules) >= _MAX_COMPILED_RULES:
+                    _compiled_rules.clear()
+                _compiled_rules[id(rule)] = entry
+            compiled_rules.append(entry[1])
+        return compiled_rules
+    
     def reload_rules(self):
         """Force reload configuration from file (useful if file was updated)."""
         self._config = None